@@ -11,23 +11,43 @@ Features:
 """
 
 import argparse
+import asyncio
+import contextlib
+import ctypes
+import functools
 import getpass
-import io
+import hashlib
+import json
 import os
+import posixpath
 import re
 import shutil
+import socket
 import sys
 import tarfile
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from pathlib import Path
+from decimal import Decimal
+from pathlib import Path, PurePosixPath
 from typing import Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
-from zipfile import ZipFile
+from urllib3.connection import HTTPConnection
+from zipfile import BadZipFile, ZipFile, ZipInfo
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 BASE_RELEASE = "https://download.rockbox.org/release/"
 BASE_DAILY = "https://download.rockbox.org/daily/"
@@ -36,22 +56,102 @@ DAILY_INDEX_TMPL = BASE_DAILY + "{device}/"
 
 # ---------------- HTTP ----------------
 UA = "Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0"
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets have SO_KEEPALIVE set."""
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", HTTPConnection.default_socket_options
+                          + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)])
+        super().init_poolmanager(*args, **kwargs)
+
 _session = requests.Session()
 _retry = Retry(total=3, backoff_factor=0.4, status_forcelist=(403, 429, 500, 502, 503, 504))
-_session.mount("https://", HTTPAdapter(max_retries=_retry))
-_session.headers.update({"User-Agent": UA, "Accept": "*/*"})
+_session.mount("https://", _KeepAliveAdapter(max_retries=_retry, pool_connections=16, pool_maxsize=16))
+_session.headers.update({"User-Agent": UA, "Accept": "*/*", "Connection": "keep-alive"})
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "rockbox-fetch" / "http"
+
+def _cache_path(url: str) -> Path:
+    return CACHE_DIR / (hashlib.sha1(url.encode()).hexdigest() + ".json")
 
+def _cache_load(url: str) -> Optional[dict]:
+    try: return json.loads(_cache_path(url).read_text())
+    except (OSError, ValueError): return None
+
+def _cache_store(url: str, headers, body: str):
+    entry = {"etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified"), "body": body}
+    if not (entry["etag"] or entry["last_modified"]): return
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = _cache_path(url).with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry)); os.replace(tmp, _cache_path(url))
+    except OSError: pass
+
+def _conditional_headers(cached: Optional[dict]) -> dict:
+    headers = {}
+    if cached:
+        if cached.get("etag"): headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"): headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+@functools.lru_cache(maxsize=32)
 def get_text(url: str, timeout=20) -> str:
-    r = _session.get(url, timeout=timeout)
+    cached = _cache_load(url)
+    r = _session.get(url, timeout=timeout, headers=_conditional_headers(cached))
+    if r.status_code == 304 and cached: return cached["body"]
     if r.status_code == 403:
         raise SystemExit(f"[!] HTTP 403 for {url}")
     r.raise_for_status()
+    _cache_store(url, r.headers, r.text)
     return r.text
 
-def get_bytes(url: str, timeout=60) -> bytes:
-    r = _session.get(url, timeout=timeout)
-    r.raise_for_status()
-    return r.content
+def _get_many(urls, max_workers: int = 8) -> dict[str, str]:
+    """Fetch several pages concurrently; URLs that fail are left out of the result."""
+    if _use_async: return asyncio.run(_aget_many(urls))
+    def fetch(u):
+        try: return u, get_text(u)
+        except (SystemExit, requests.RequestException): return u, None
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls)) or 1) as ex:
+        return {u: t for u, t in ex.map(fetch, urls) if t is not None}
+
+def get_to_file(url: str, path: Path, chunk: int = 1 << 20, timeout=60) -> Path:
+    with _session.get(url, stream=True, timeout=timeout) as r:
+        r.raise_for_status()
+        with open(path, "wb") as f:
+            for c in r.iter_content(chunk):
+                if c: f.write(c)
+    return path
+
+# ---------------- HTTP (asyncio, optional) ----------------
+_use_async = False  # set by --async; requires aiohttp
+
+def _aio_session(**kw) -> "aiohttp.ClientSession":
+    return aiohttp.ClientSession(headers={"User-Agent": UA, "Accept": "*/*"}, **kw)
+
+async def _aget_text(session, url: str) -> Optional[str]:
+    cached = _cache_load(url)
+    try:
+        async with session.get(url, headers=_conditional_headers(cached)) as r:
+            if r.status == 304 and cached: return cached["body"]
+            if r.status >= 400: return None
+            body = await r.text()
+    except (aiohttp.ClientError, asyncio.TimeoutError): return None
+    _cache_store(url, r.headers, body)
+    return body
+
+async def _aget_many(urls) -> dict[str, str]:
+    async with _aio_session(timeout=aiohttp.ClientTimeout(total=20)) as session:
+        bodies = await asyncio.gather(*(_aget_text(session, u) for u in urls))
+    return {u: t for u, t in zip(urls, bodies) if t is not None}
+
+async def _aget_to_file(url: str, path: Path, chunk: int = 1 << 20) -> Path:
+    async with _aio_session(timeout=aiohttp.ClientTimeout(sock_read=60)) as session:
+        async with session.get(url) as r:
+            r.raise_for_status()
+            with open(path, "wb") as f:
+                async for c in r.content.iter_chunked(chunk):
+                    await asyncio.to_thread(f.write, c)
+    return path
 
 # ---------------- Logging ----------------
 def log(msg: str): print(f"[+] {msg}")
@@ -67,11 +167,19 @@ def parse_args():
     g.add_argument("--release", help="Release version (e.g., 4.0).")
     p.add_argument("--label", help="Volume label (e.g., H2).")
     p.add_argument("--mount-path", help="Explicit mount point of SD root.")
-    p.add_argument("--mount-root", default=f"/run/media/{getpass.getuser()}",
-                   help="Root under which removable volumes are mounted.")
+    p.add_argument("--mount-root",
+                   help="Root under which removable volumes are mounted (default: /run/media/$USER).")
     p.add_argument("--revert", nargs="?", const="latest",
-                   help="Restore previous backup (omit for latest, or pass tarball path).")
+                   help="Restore previous backup (omit for latest, or pass tarball/snapshot path).")
     p.add_argument("--dry-run", action="store_true", help="Plan only; no writes.")
+    p.add_argument("--backup-mode", choices=("tar", "hardlink", "none"), default="tar",
+                   help="Backup before deploy: tarball, hardlink snapshot (falls back to tar on FAT), or none.")
+    p.add_argument("--strict-check", action="store_true",
+                   help="Probe the card with a real file write instead of a permission check.")
+    p.add_argument("--fast-sync", action=argparse.BooleanOptionalAction, default=True,
+                   help="Skip files whose size and mtime already match on the card (default: on).")
+    p.add_argument("--async", dest="use_async", action="store_true",
+                   help="Use asyncio/aiohttp for listings and the download (needs aiohttp).")
     p.add_argument("-v", "--verbose", action="store_true", help="Verbose logging.")
 
     # Listing
@@ -82,66 +190,64 @@ def parse_args():
     return p.parse_args()
 
 # ---------------- Build discovery ----------------
-NIGHTLY_RE = re.compile(r"rockbox-(?P<device>[a-z0-9]+)-(?P<date>\d{8})\.zip")
+RELEASE_DIR_RE = re.compile(r'href="(\d+(?:\.\d+)+)/"')
+DEVICE_DIR_RE = re.compile(r'href="([a-z0-9]+)/"')
+SHTML_DEVICE_RE = re.compile(r'href="/?daily/([a-z0-9]+)/|rockbox-([a-z0-9]+)-\d{8}\.zip')
+DATE_RE = re.compile(r"\d{8}")
+
+@functools.lru_cache(maxsize=None)
+def _nightly_re_for(device: str) -> re.Pattern:
+    return re.compile(rf"rockbox-{re.escape(device)}-(\d{{8}})\.zip")
+
+def _nightly_dates(text: str, device: str) -> set[str]:
+    # A single scan of the page covers both plain text and href targets.
+    return {m.group(1) for m in _nightly_re_for(device).finditer(text)}
 
 def latest_nightly_url_for_device(device: str) -> Tuple[str, str]:
     text = get_text(DAILY_INDEX_TMPL.format(device=device))
-    dates = [m.group("date") for m in NIGHTLY_RE.finditer(text) if m.group("device") == device]
-    if not dates:
-        for h in re.findall(r'href="([^"]+)"', text):
-            mm = NIGHTLY_RE.search(h)
-            if mm and mm.group("device") == device:
-                dates.append(mm.group("date"))
-    if not dates: die(f"No nightly builds found for {device}")
-    latest = max(dates)
+    # YYYYMMDD compares correctly as a string, so track the newest date inline.
+    latest = ""
+    for m in _nightly_re_for(device).finditer(text):
+        if m.group(1) > latest: latest = m.group(1)
+    if not latest: die(f"No nightly builds found for {device}")
     return urljoin(BASE_DAILY + f"{device}/", f"rockbox-{device}-{latest}.zip"), latest
 
 def nightly_url_for_date(device: str, yyyymmdd: str) -> str:
-    if not re.fullmatch(r"\d{8}", yyyymmdd): die("--date must be YYYYMMDD")
+    if not DATE_RE.fullmatch(yyyymmdd): die("--date must be YYYYMMDD")
     return urljoin(BASE_DAILY + f"{device}/", f"rockbox-{device}-{yyyymmdd}.zip")
 
 def release_url(device: str, version: str) -> str:
     return urljoin(BASE_RELEASE, f"{version}/rockbox-{device}-{version}.zip")
 
 def list_releases() -> list[str]:
-    text = get_text(BASE_RELEASE)
-    hrefs = re.findall(r'href="([^"/]+)/"', text)
-    versions = [h for h in hrefs if re.fullmatch(r"\d+(\.\d+)+", h)]
+    versions = RELEASE_DIR_RE.findall(get_text(BASE_RELEASE))
     versions.sort(key=lambda v: tuple(map(int, v.split("."))), reverse=True)
     return versions
 
 def list_devices_from_daily() -> list[str]:
-    try:
-        text = get_text(BASE_DAILY)
-        dirs = re.findall(r'href="([a-z0-9]+)/"', text)
-        if dirs: return sorted(set(dirs))
-    except SystemExit: pass
-    page = get_text(DAILY_SHTML)
-    cand = set(re.findall(r'href="/?daily/([a-z0-9]+)/', page))
-    cand |= set(re.findall(r'rockbox-([a-z0-9]+)-\d{8}\.zip', page))
-    return sorted(cand)
+    pages = _get_many([BASE_DAILY, DAILY_SHTML])
+    dirs = DEVICE_DIR_RE.findall(pages.get(BASE_DAILY, ""))
+    if dirs: return sorted(set(dirs))
+    if DAILY_SHTML not in pages: die(f"Could not fetch {BASE_DAILY} or {DAILY_SHTML}")
+    return sorted({a or b for a, b in SHTML_DEVICE_RE.findall(pages[DAILY_SHTML])})
 
 def list_dailies_for_device(device: str) -> list[str]:
-    try:
-        text = get_text(DAILY_INDEX_TMPL.format(device=device))
-        dates = [m.group("date") for m in NIGHTLY_RE.finditer(text) if m.group("device") == device]
-        for h in re.findall(r'href="([^"]+)"', text):
-            mm = NIGHTLY_RE.search(h)
-            if mm and mm.group("device") == device: dates.append(mm.group("date"))
-        out = sorted(set(dates), reverse=True)
-        if out: return out
-    except SystemExit: pass
-    page = get_text(DAILY_SHTML)
-    return sorted(set(re.findall(rf'rockbox-{re.escape(device)}-(\d{{8}})\.zip', page)), reverse=True)
+    index_url = DAILY_INDEX_TMPL.format(device=device)
+    pages = _get_many([index_url, DAILY_SHTML])
+    out = sorted(_nightly_dates(pages.get(index_url, ""), device), reverse=True)
+    if out: return out
+    if DAILY_SHTML not in pages: die(f"Could not fetch {index_url} or {DAILY_SHTML}")
+    return sorted(_nightly_dates(pages[DAILY_SHTML], device), reverse=True)
 
 # ---------------- FS helpers ----------------
-def resolve_mount_path(label: Optional[str], mount_root: str, mount_path_cli: Optional[str]) -> Path:
+def resolve_mount_path(label: Optional[str], mount_root: Optional[str], mount_path_cli: Optional[str]) -> Path:
     if mount_path_cli:
         mp = Path(mount_path_cli).expanduser().resolve()
         if not mp.exists(): die(f"--mount-path does not exist: {mp}")
         return mp
     if not label: die("Provide --label or --mount-path")
-    root = Path(mount_root).expanduser()
+    # Resolved here rather than as an argparse default so --list-* never looks up the user.
+    root = Path(mount_root or f"/run/media/{getpass.getuser()}").expanduser()
     candidate = root / label
     if not candidate.is_dir():
         alts = [p for p in root.glob("*") if p.is_dir() and p.name.lower() == label.lower()]
@@ -151,59 +257,236 @@ def resolve_mount_path(label: Optional[str], mount_root: str, mount_path_cli: Op
 
 def find_dot_rockbox(root: Path) -> Path: return root / ".rockbox"
 
-def ensure_writable(path: Path):
-    testfile = path / f".write_test_{int(time.time())}"
+def ensure_writable(path: Path, strict: bool = False):
+    if not os.access(path, os.W_OK): die(f"Cannot write to {path}")
+    if not strict: return
+    # Read-only remounts can still report W_OK; only a real write proves otherwise.
     try:
-        with open(testfile, "w") as f: f.write("ok")
+        with tempfile.TemporaryFile(dir=path, prefix=".write_test_") as f: f.write(b"ok")
     except Exception as e: die(f"Cannot write to {path}: {e}")
-    finally:
-        try: testfile.unlink(missing_ok=True)
-        except Exception: pass
+
+def _safe_dest(root: Path, name: str) -> Path:
+    parts = PurePosixPath(name).parts
+    if not parts or parts[0] == "/" or ".." in parts: die(f"Unsafe path in archive: {name}")
+    return root.joinpath(*parts)
+
+def _matches(dst, size: int, mtime_ns: int) -> bool:
+    """The --fast-sync rule: dst already exists with this size and mtime."""
+    try: d = os.stat(dst)
+    except FileNotFoundError: return False
+    return d.st_size == size and d.st_mtime_ns == mtime_ns
+
+def sync_fs(path: Path):
+    """Flush the filesystem holding path once, rather than per file.
+
+    Individual writes are never fsync'd; the card is only safe to remove after this returns
+    (which was already the case before).
+    """
+    libc = ctypes.CDLL(None, use_errno=True) if sys.platform.startswith("linux") else None
+    if libc is not None and hasattr(libc, "syncfs"):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if libc.syncfs(fd) == 0: return
+        finally: os.close(fd)
+    if hasattr(os, "sync"): os.sync()
 
 # ---------------- Backup / Revert ----------------
 def backups_dir(root: Path) -> Path:
     b = root / ".rockbox_backups"; b.mkdir(exist_ok=True); return b
 
-def create_backup(dot_rockbox: Path, dry: bool, verbose: bool) -> Optional[Path]:
+def create_backup(dot_rockbox: Path, dry: bool, verbose: bool, mode: str = "tar") -> Optional[Path]:
+    if mode == "none": log("Skipping backup (--backup-mode none)."); return None
     if not dot_rockbox.exists():
         warn(f"No {dot_rockbox} to back up."); return None
     ts = datetime.now().strftime("%Y%m%d-%H%M%S")
-    out = backups_dir(dot_rockbox.parent) / f"rockbox-backup-{ts}.tar.gz"
+    if mode == "hardlink":
+        out = backups_dir(dot_rockbox.parent) / f"rockbox-backup-{ts}"
+        if dry:
+            # Probing link support would mean writing to the card, which --dry-run must not do.
+            log(f"[dry-run] Would snapshot: {out} (or fall back to tar if the filesystem lacks hard links, "
+                "e.g. FAT/exFAT)"); return out
+        log(f"Creating hardlink snapshot: {out}")
+        try:
+            create_backup_hardlink(dot_rockbox, out / ".rockbox"); return out
+        except OSError as e:
+            # FAT/exFAT cards have no hard links.
+            warn(f"Hardlink snapshot failed ({e}); falling back to tar.")
+            shutil.rmtree(out, ignore_errors=True)
+    # .rockbox is mostly already-compressed blobs: plain tar, or fast zstd when available.
+    ext = ".tar.zst" if zstandard else ".tar"
+    out = backups_dir(dot_rockbox.parent) / f"rockbox-backup-{ts}{ext}"
     if dry: log(f"[dry-run] Would back up: {out}"); return out
     log(f"Creating backup: {out}")
-    with tarfile.open(out, "w:gz") as tar: tar.add(dot_rockbox, arcname=".rockbox")
+    if zstandard:
+        with open(out, "wb") as f, zstandard.ZstdCompressor(level=1).stream_writer(f) as zw, \
+                tarfile.open(fileobj=zw, mode="w|", bufsize=1 << 20) as tar:
+            tar.add(dot_rockbox, arcname=".rockbox")
+    else:
+        with tarfile.open(out, "w|", bufsize=1 << 20) as tar: tar.add(dot_rockbox, arcname=".rockbox")
     return out
 
+def create_backup_hardlink(dot_rockbox: Path, out_dir: Path):
+    """Snapshot dot_rockbox as a tree of hard links (cp -al); raises OSError where links are unsupported."""
+    for root, dirs, files in os.walk(dot_rockbox):
+        dst_sub = out_dir / Path(root).relative_to(dot_rockbox)
+        dst_sub.mkdir(parents=True, exist_ok=True)
+        for f in files: os.link(os.path.join(root, f), dst_sub / f)
+
+BACKUP_SUFFIXES = (".tar", ".tar.gz", ".tar.zst")
+
 def list_backups(root: Path) -> list[Path]:
-    return sorted(backups_dir(root).glob("rockbox-backup-*.tar.gz"), key=lambda p: p.stat().st_mtime)
+    found = [p for p in backups_dir(root).glob("rockbox-backup-*")
+             if p.is_dir() or p.name.endswith(BACKUP_SUFFIXES)]
+    return sorted(found, key=lambda p: p.stat().st_mtime)
+
+@contextlib.contextmanager
+def _open_backup(backup_tar: Path):
+    # TarFile leaves an external fileobj open, so the stack owns the zstd reader and its file.
+    with contextlib.ExitStack() as stack:
+        if backup_tar.name.endswith(".zst"):
+            if not zstandard: die(f"{backup_tar.name} needs the 'zstandard' package")
+            raw = stack.enter_context(open(backup_tar, "rb"))
+            reader = stack.enter_context(zstandard.ZstdDecompressor().stream_reader(raw))
+            yield stack.enter_context(tarfile.open(fileobj=reader, mode="r|", bufsize=1 << 20))
+        else:
+            yield stack.enter_context(tarfile.open(backup_tar, "r|*", bufsize=1 << 20))
+
+def _tar_mtime_ns(member: tarfile.TarInfo) -> int:
+    # PAX headers carry the exact decimal mtime; member.mtime is a lossy float.
+    pax = member.pax_headers.get("mtime")
+    return int(Decimal(pax) * 1_000_000_000) if pax else int(member.mtime) * 1_000_000_000
+
+def _symlink_target(member: tarfile.TarInfo) -> Optional[str]:
+    """Archive path a symlink member resolves to, or None if it escapes .rockbox."""
+    if member.linkname.startswith("/"): return None
+    target = posixpath.normpath(posixpath.join(posixpath.dirname(member.name), member.linkname))
+    return target if target == ".rockbox" or target.startswith(".rockbox/") else None
 
 def restore_backup(root: Path, backup_tar: Path, dry: bool):
-    dot_rockbox = root / ".rockbox"
+    """Restore a backup authoritatively: --fast-sync does not apply, every backed-up file is rewritten."""
     if dry: log(f"[dry-run] Would restore {backup_tar}"); return
     log(f"Restoring {backup_tar.name}")
-    with tempfile.TemporaryDirectory() as td:
-        td_path = Path(td)
-        with tarfile.open(backup_tar, "r:gz") as tar: tar.extractall(td_path)
-        merge_copy(td_path / ".rockbox", dot_rockbox)
+    if backup_tar.is_dir():
+        if not (backup_tar / ".rockbox").is_dir(): die(f"Not a backup snapshot (no .rockbox inside): {backup_tar}")
+        merge_copy(backup_tar / ".rockbox", root / ".rockbox", fast_sync=False); sync_fs(root); return
+    (root / ".rockbox").mkdir(exist_ok=True)
+    with _open_backup(backup_tar) as tar:
+        for member in tar:
+            if member.name != ".rockbox" and not member.name.startswith(".rockbox/"): continue
+            dst = _safe_dest(root, member.name)
+            if member.isdir(): dst.mkdir(parents=True, exist_ok=True); continue
+            if not (member.isfile() or member.islnk() or member.issym()):
+                warn(f"Skipping unsupported tar member: {member.name}"); continue
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            if dst.is_symlink(): dst.unlink()
+            if member.issym():
+                if _symlink_target(member) is None:
+                    warn(f"Skipping symlink pointing outside .rockbox: {member.name}"); continue
+                if dst.exists(): dst.unlink()
+                os.symlink(member.linkname, dst); continue
+            _unshare(dst)
+            if member.islnk():
+                # Second path to an inode restored earlier in the stream: copy it, since
+                # FAT/exFAT cards cannot hold hard links.
+                target = _safe_dest(root, member.linkname)
+                if not member.linkname.startswith(".rockbox/") or not target.is_file():
+                    warn(f"Skipping hard link with missing target: {member.name} -> {member.linkname}"); continue
+                shutil.copyfile(target, dst)
+            else:
+                with tar.extractfile(member) as src, open(dst, "wb") as out: shutil.copyfileobj(src, out, 1 << 20)
+            mtime_ns = _tar_mtime_ns(member)
+            os.utime(dst, ns=(mtime_ns, mtime_ns))
+            os.chmod(dst, member.mode & 0o777)
+    sync_fs(root)
 
 # ---------------- Merge copy ----------------
-def merge_copy(src_dir: Path, dst_dir: Path):
+def _unshare(dst):
+    # Writing in place would also rewrite any hardlink snapshot of the file; unlink it first.
+    try:
+        if os.stat(dst).st_nlink > 1: os.unlink(dst)
+    except FileNotFoundError: pass
+
+def _same_inode(src: os.DirEntry, dst) -> bool:
+    # A file still hard-linked to its snapshot is identical by definition.
+    try: d = os.stat(dst)
+    except FileNotFoundError: return False
+    return (d.st_dev, d.st_ino) == (src.stat().st_dev, src.inode())
+
+def _unchanged(src: os.DirEntry, dst) -> bool:
+    s = src.stat()
+    return _matches(dst, s.st_size, s.st_mtime_ns)
+
+def _fast_copyfile(src, dst, st: Optional[os.stat_result] = None):
+    """Copy src to dst, preserving times and mode bits.
+
+    shutil.copyfile already uses os.sendfile on Linux and falls back to a read/write loop
+    where the filesystem rejects it.
+    """
+    st = st or os.stat(src)
+    _unshare(dst)
+    shutil.copyfile(src, dst)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.chmod(dst, st.st_mode & 0o777)
+
+def _run_parallel(fn, jobs: list[tuple]):
+    """Run fn(*job) for every job on a thread pool; the first failure is re-raised."""
+    if not jobs: return
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as ex:
+        for fut in as_completed([ex.submit(fn, *j) for j in jobs]): fut.result()
+
+def _collect_copies(src_dir: Path, dst_dir: Path, fast_sync: bool, jobs: list[tuple]):
+    # Directories are created here, serially, so the copy workers never race on mkdir.
     dst_dir.mkdir(exist_ok=True)
-    for root, dirs, files in os.walk(src_dir):
-        rel = Path(root).relative_to(src_dir)
-        dst_sub = dst_dir / rel; dst_sub.mkdir(exist_ok=True)
-        for d in dirs: (dst_sub / d).mkdir(exist_ok=True)
-        for f in files: shutil.copy2(Path(root)/f, dst_sub/f)
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            dst = dst_dir / entry.name
+            if entry.is_dir(follow_symlinks=False):
+                _collect_copies(Path(entry.path), dst, fast_sync, jobs)
+            elif fast_sync and _unchanged(entry, dst): continue
+            elif not fast_sync and _same_inode(entry, dst): continue
+            else:
+                # DirEntry caches its stat, so the copy reuses it instead of stat-ing again.
+                jobs.append((entry.path, dst, entry.stat()))
+
+def merge_copy(src_dir: Path, dst_dir: Path, fast_sync: bool = True):
+    jobs: list[tuple] = []
+    _collect_copies(src_dir, dst_dir, fast_sync, jobs)
+    _run_parallel(_fast_copyfile, jobs)
 
 # ---------------- Deploy ----------------
-def unzip_and_deploy(zip_bytes: bytes, mount_root: Path, dry: bool, verbose: bool):
-    with ZipFile(io.BytesIO(zip_bytes)) as zf:
-        if ".rockbox" not in {p.split("/")[0] for p in zf.namelist() if "/" in p}:
-            die("Archive lacks .rockbox")
-        with tempfile.TemporaryDirectory() as td:
-            td_path = Path(td); zf.extractall(td_path)
-            if dry: log("[dry-run] Would merge into .rockbox"); return
-            merge_copy(td_path/".rockbox", mount_root/".rockbox")
+def open_zip(zip_path: Path) -> ZipFile:
+    try: return ZipFile(zip_path, mode="r", allowZip64=True)
+    except BadZipFile as e: die(f"Corrupt download: {e}")
+
+def verify_zip(zf: ZipFile) -> list[ZipInfo]:
+    """Probe for .rockbox and CRC-check every member before anything on the card is touched."""
+    # infolist() is the parsed central directory itself; filter it once for probe + extract.
+    members = [i for i in zf.infolist() if i.filename.startswith(".rockbox/")]
+    if not members: die("Archive lacks .rockbox")
+    bad = zf.testzip()
+    if bad is not None: die(f"Corrupt member: {bad}")
+    return members
+
+def _extract_member(zf: ZipFile, info: ZipInfo, dst: Path, mtime: int):
+    _unshare(dst)
+    with zf.open(info) as src, open(dst, "wb") as out: shutil.copyfileobj(src, out, 1 << 20)
+    os.utime(dst, (mtime, mtime))
+
+def unzip_and_deploy(zf: ZipFile, members: list[ZipInfo], mount_root: Path, dry: bool, verbose: bool,
+                     fast_sync: bool = True):
+    if dry: log("[dry-run] Would merge into .rockbox"); return
+    (mount_root / ".rockbox").mkdir(exist_ok=True)
+    jobs = []
+    for info in members:
+        dst = _safe_dest(mount_root, info.filename)
+        if info.is_dir(): dst.mkdir(parents=True, exist_ok=True); continue
+        mtime = int(time.mktime(info.date_time + (0, 0, -1)))
+        if fast_sync and _matches(dst, info.file_size, mtime * 1_000_000_000): continue
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        jobs.append((zf, info, dst, mtime))
+    # ZipFile serialises reads of its shared file handle, so members can be written concurrently.
+    _run_parallel(_extract_member, jobs)
+    sync_fs(mount_root)
 
 # ---------------- Main ----------------
 def _print_capped(items, max_list: int):
@@ -214,7 +497,11 @@ def _print_capped(items, max_list: int):
         for v in items: print("  ", v)
 
 def main():
+    global _use_async
     args = parse_args()
+    if args.use_async:
+        if aiohttp is None: die("--async needs the 'aiohttp' package")
+        _use_async = True
 
     if args.list_releases:
         rels = list_releases(); log("Releases:"); _print_capped(rels, args.max_list); return
@@ -229,7 +516,7 @@ def main():
         mp = resolve_mount_path(args.label, args.mount_root, args.mount_path)
         backup_tar = list_backups(mp)[-1] if args.revert == "latest" else Path(args.revert)
         if not backup_tar.exists(): die(f"Backup not found: {backup_tar}")
-        ensure_writable(mp); restore_backup(mp, backup_tar, args.dry_run); return
+        ensure_writable(mp, args.strict_check); restore_backup(mp, backup_tar, args.dry_run); return
 
     if not args.device: die("Need --device for deployment")
     mp = resolve_mount_path(args.label, args.mount_root, args.mount_path)
@@ -243,15 +530,25 @@ def main():
         url, latest = latest_nightly_url_for_device(args.device); label = f"nightly {latest}"
 
     log(f"Selected build: {label}\nURL: {url}")
-    ensure_writable(mp)
-    backup_path = create_backup(dot_rb, args.dry_run, args.verbose)
-    if backup_path: log(f"Backup: {backup_path}")
-    if args.dry_run: return
+    ensure_writable(mp, args.strict_check)
+    if args.dry_run:
+        create_backup(dot_rb, args.dry_run, args.verbose, args.backup_mode); return
 
     log("Downloading...")
-    zbytes = get_bytes(url)
-    log("Deploying...")
-    unzip_and_deploy(zbytes, mp, args.dry_run, args.verbose)
+    with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tf:
+        zip_path = Path(tf.name)
+    try:
+        if _use_async: asyncio.run(_aget_to_file(url, zip_path))
+        else: get_to_file(url, zip_path)
+        # One ZipFile (one central-directory parse) serves the probe, the CRC check and extraction.
+        with open_zip(zip_path) as zf:
+            members = verify_zip(zf)
+            backup_path = create_backup(dot_rb, args.dry_run, args.verbose, args.backup_mode)
+            if backup_path: log(f"Backup: {backup_path}")
+            log("Deploying...")
+            unzip_and_deploy(zf, members, mp, args.dry_run, args.verbose, args.fast_sync)
+    finally:
+        zip_path.unlink(missing_ok=True)
     log("Done.")
 
 if __name__ == "__main__":